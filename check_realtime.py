@@ -0,0 +1,83 @@
+import os
+import sys
+import time
+import shutil
+import signal
+import tempfile
+import subprocess
+
+from review_stub_server import ReviewStubServer
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+# Config files the daemon's imports read relative to the working directory
+CONFIG_FILES = ["companies.json", "expanded_category_keywords.json"]
+STARTUP_TIMEOUT = 60
+UPDATE_TIMEOUT = 15
+
+
+def wait_for(condition, timeout):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.1)
+    return False
+
+def mtime(path):
+    return os.stat(path).st_mtime_ns if os.path.exists(path) else None
+
+def run_check():
+    """Run the daemon against the stand-in server and check a new review reaches churn_predictions.json."""
+    workdir = tempfile.mkdtemp(prefix="realtime_check_")
+    for name in CONFIG_FILES:
+        shutil.copy(os.path.join(REPO_DIR, name), workdir)
+    predictions = os.path.join(workdir, "model_output", "churn_predictions.json")
+    raw_csv = os.path.join(workdir, "data", "raw", "stub_reviews.csv")
+
+    server = ReviewStubServer(port=0)
+    for _ in range(10):
+        server.publish()
+    server.start()
+
+    env = dict(os.environ, PYTHONPATH=REPO_DIR)
+    daemon = subprocess.Popen(
+        [sys.executable, os.path.join(REPO_DIR, "realtime_daemon.py"), "Stub",
+         "--url", f"Stub={server.url}", "--interval", "1", "--min-reviews", "1"],
+        cwd=workdir, env=env,
+    )
+    try:
+        if not wait_for(lambda: os.path.exists(predictions), STARTUP_TIMEOUT):
+            print("❌ Daemon never wrote churn_predictions.json for the initial reviews")
+            return False
+        before = mtime(predictions)
+
+        review = server.publish(rating=1)
+        published_at = time.time()
+        if not wait_for(lambda: mtime(predictions) != before, UPDATE_TIMEOUT):
+            print(f"❌ churn_predictions.json not updated within {UPDATE_TIMEOUT}s of a new review")
+            return False
+        latency = time.time() - published_at
+
+        with open(raw_csv, "r", encoding="utf-8") as f:
+            if review["text"] not in f.read():
+                print("❌ New review missing from the raw CSV")
+                return False
+        with open(predictions, "r") as f:
+            if "stub_reviews" not in f.read():
+                print("❌ churn_predictions.json has no entry for the stand-in company")
+                return False
+
+        print(f"✅ churn_predictions.json updated {latency:.1f}s after a new review was published")
+        return True
+    finally:
+        if os.name == "nt":
+            daemon.terminate()
+        else:
+            daemon.send_signal(signal.SIGINT)
+        daemon.wait(timeout=30)
+        server.stop()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_check() else 1)
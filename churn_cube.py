@@ -0,0 +1,237 @@
+import os
+import time
+import uuid
+from contextlib import contextmanager
+import pandas as pd
+
+CUBE_FILE = "data/churn_cube.csv"
+LOCK_TIMEOUT = 30  # age in seconds after which a leftover lock file is treated as stale
+
+KEYS = ["company", "category", "day"]
+MEASURES = ["reviews", "churned", "rating_sum", "sentiment_sum"]
+FREQUENCIES = {"D": "day", "W": "week", "M": "month"}
+
+
+def aggregate_reviews(df):
+    """Collapse typed review rows into per company/category/day counts."""
+    dated = df[df["Review Date"].notna()]
+    if len(dated) < len(df):
+        print(f"⚠️ {len(df) - len(dated)} reviews without a date left out of the churn cube")
+    ratings = dated["Rating"].astype(int)
+    if "Sentiment Score" in dated.columns:
+        sentiment = dated["Sentiment Score"].astype(float)
+    else:
+        sentiment = 0.0
+    frame = pd.DataFrame({
+        "company": dated["Company"].astype(str).str.lower(),
+        "category": dated["Product Category"].astype(str),
+        "day": dated["Review Date"].dt.normalize(),
+        "reviews": 1,
+        "churned": (ratings <= 2).astype(int),
+        "rating_sum": ratings,
+        "sentiment_sum": sentiment,
+    })
+    return frame.groupby(KEYS, as_index=False)[MEASURES].sum()
+
+@contextmanager
+def file_lock(path):
+    """Cross-process lock via an exclusively created <path>.lock file."""
+    lock_path = path + ".lock"
+    token = f"{os.getpid()}-{uuid.uuid4().hex}"
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > LOCK_TIMEOUT:
+                    # Left behind by a process that died mid-save
+                    os.remove(lock_path)
+                    continue
+            except FileNotFoundError:
+                continue
+            time.sleep(0.05)
+    with os.fdopen(fd, "w") as f:
+        f.write(token)
+    try:
+        yield
+    finally:
+        # Only remove the lock if it's still ours, not one taken over after we went stale
+        try:
+            with open(lock_path, "r") as f:
+                owned = f.read() == token
+            if owned:
+                os.remove(lock_path)
+        except FileNotFoundError:
+            pass
+
+def typed_counts(counts):
+    """Fix column dtypes; a header-only CSV otherwise loads everything as object."""
+    return counts.astype({
+        "company": str, "category": str,
+        "reviews": "int64", "churned": "int64", "rating_sum": "int64", "sentiment_sum": "float64",
+    }).assign(day=pd.to_datetime(counts["day"]))
+
+def fill_periods(counts, freq):
+    """Reindex per-period counts onto every period in their range, zero-filling quiet ones."""
+    if counts.empty:
+        return counts
+    periods = pd.period_range(counts["day"].min(), counts["day"].max(), freq=freq).start_time
+    filled = counts.set_index("day").reindex(periods.astype(counts["day"].dtype), fill_value=0)
+    return filled.rename_axis("day").reset_index()
+
+def summarize(counts):
+    """Add churn %, average rating and average sentiment to summed counts."""
+    counts = counts.copy()
+    counts["churn_pct"] = (counts["churned"] / counts["reviews"] * 100).round(2)
+    counts["avg_rating"] = (counts["rating_sum"] / counts["reviews"]).round(2)
+    counts["avg_sentiment"] = (counts["sentiment_sum"] / counts["reviews"]).round(4)
+    return counts
+
+
+class ChurnCube:
+    """Pre-aggregated churn counts keyed by company x category x day.
+
+    The daily table is the only thing stored on disk; weekly and monthly
+    rollups are built from it on demand and cached until the next update,
+    so queries never touch individual reviews.
+
+    eda.py and the real-time daemon both update the same file, so save()
+    re-reads it under a lock and applies only this instance's own changes:
+    companies it rebuilt replace theirs, and increments are added on top.
+    """
+
+    def __init__(self, path=CUBE_FILE):
+        self.path = path
+        self.daily = self._read()
+        self._pending = []        # increments added since the last save
+        self._replaced = set()    # companies rebuilt since the last save
+        self._rollups = {}
+
+    def _read(self):
+        if os.path.exists(self.path):
+            return typed_counts(pd.read_csv(self.path))
+        return typed_counts(pd.DataFrame(columns=KEYS + MEASURES))
+
+    def _merge(self, counts):
+        merged = pd.concat([self.daily, counts], ignore_index=True)
+        self.daily = merged.groupby(KEYS, as_index=False)[MEASURES].sum()
+        self._rollups = {}
+
+    def add_reviews(self, df):
+        """Fold newly arrived reviews into the existing counts."""
+        counts = aggregate_reviews(df)
+        self._merge(counts)
+        self._pending.append(counts)
+
+    def replace_companies(self, df):
+        """Rebuild the counts of every company in df from its full set of reviews.
+
+        Returns the cube keys of the rebuilt companies.
+        """
+        counts = aggregate_reviews(df)
+        companies = list(counts["company"].unique())
+        self.daily = self.daily[~self.daily["company"].isin(companies)]
+        self._merge(counts)
+        self._replaced.update(companies)
+        return companies
+
+    def save(self):
+        """Merge this instance's changes into the file on disk and write it back."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with file_lock(self.path):
+            disk = self._read()
+            rebuilt = self.daily[self.daily["company"].isin(self._replaced)]
+            # Increments for rebuilt companies are already part of `rebuilt`
+            increments = [counts[~counts["company"].isin(self._replaced)] for counts in self._pending]
+            merged = pd.concat(
+                [disk[~disk["company"].isin(self._replaced)], rebuilt, *increments], ignore_index=True
+            )
+            self.daily = typed_counts(merged.groupby(KEYS, as_index=False)[MEASURES].sum())
+
+            tmp_path = self.path + ".tmp"
+            self.daily.to_csv(tmp_path, index=False, date_format="%Y-%m-%d")
+            os.replace(tmp_path, self.path)
+        self._pending = []
+        self._replaced = set()
+        self._rollups = {}
+
+    def rollup(self, freq="D"):
+        """Counts per company/category/period for freq 'D', 'W' or 'M'."""
+        if freq not in FREQUENCIES:
+            raise ValueError(f"Unknown frequency {freq!r}, expected one of {list(FREQUENCIES)}")
+        if freq == "D":
+            return self.daily
+        if freq not in self._rollups:
+            periods = self.daily.assign(day=self.daily["day"].dt.to_period(freq).dt.start_time)
+            self._rollups[freq] = periods.groupby(KEYS, as_index=False)[MEASURES].sum()
+        return self._rollups[freq]
+
+    def _select(self, counts, company=None, category=None, start=None, end=None):
+        mask = pd.Series(True, index=counts.index)
+        if company is not None:
+            mask &= counts["company"] == company.lower()
+        if category is not None:
+            mask &= counts["category"] == category
+        if start is not None:
+            mask &= counts["day"] >= pd.Timestamp(start)
+        if end is not None:
+            mask &= counts["day"] <= pd.Timestamp(end)
+        return counts[mask]
+
+    def window(self, company=None, category=None, start=None, end=None):
+        """Totals for any date range; omitted filters cover everything."""
+        selected = self._select(self.daily, company, category, start, end)
+        result = {col: selected[col].sum().item() for col in MEASURES}
+        reviews = result["reviews"]
+        result["churn_pct"] = round(result["churned"] / reviews * 100, 2) if reviews else None
+        result["avg_rating"] = round(result["rating_sum"] / reviews, 2) if reviews else None
+        result["avg_sentiment"] = round(result["sentiment_sum"] / reviews, 4) if reviews else None
+        return result
+
+    def trend(self, company=None, category=None, freq="W", start=None, end=None):
+        """Per-period series with churn % and its change from the previous period.
+
+        Periods without reviews are kept with zero counts, so churn_change is
+        always against the immediately preceding period (NaN after a gap).
+        """
+        selected = self._select(self.rollup(freq), company, category, start, end)
+        series = fill_periods(selected.groupby("day", as_index=False)[MEASURES].sum(), freq)
+        series = summarize(series).rename(columns={"day": FREQUENCIES[freq]})
+        series["churn_change"] = series["churn_pct"].diff().round(2)
+        return series.reset_index(drop=True)
+
+    def latest_changes(self, freq="W"):
+        """Latest period vs the calendar period before it for every company/category.
+
+        previous_churn_pct and churn_change are None when that previous
+        period had no reviews.
+        """
+        counts = summarize(self.rollup(freq)).sort_values(KEYS)
+        rows = []
+        for (company, category), group in counts.groupby(["company", "category"]):
+            latest = group.iloc[-1]
+            previous_day = (latest["day"].to_period(freq) - 1).start_time
+            previous = group[group["day"] == previous_day]
+            previous_churn = previous["churn_pct"].iloc[0] if len(previous) else None
+            rows.append({
+                "company": company,
+                "category": category,
+                "period": latest["day"],
+                "churn_pct": latest["churn_pct"],
+                "previous_churn_pct": previous_churn,
+                "churn_change": round(latest["churn_pct"] - previous_churn, 2) if previous_churn is not None else None,
+            })
+        return pd.DataFrame(rows, columns=["company", "category", "period", "churn_pct",
+                                           "previous_churn_pct", "churn_change"])
+
+
+if __name__ == "__main__":
+    import sys
+
+    # e.g. python churn_cube.py meesho Fashion W
+    cube = ChurnCube()
+    company = sys.argv[1] if len(sys.argv) > 1 else None
+    category = sys.argv[2] if len(sys.argv) > 2 else None
+    freq = sys.argv[3] if len(sys.argv) > 3 else "W"
+    print(cube.trend(company, category, freq=freq).to_string(index=False))
@@ -4,6 +4,7 @@ import re
 import json
 from nltk.corpus import stopwords
 import nltk
+from schema import validate_reviews
 
 # Ensure NLTK stopwords are available
 nltk.download('stopwords')
@@ -35,22 +36,21 @@ def assign_category(review_text):
             return category
     return "General"
 
-# Process all raw CSVs
-for filename in os.listdir(RAW_FOLDER):
-    if filename.endswith(".csv"):
-        file_path = os.path.join(RAW_FOLDER, filename)
-        df = pd.read_csv(file_path)
+if __name__ == "__main__":
+    # Process all raw CSVs
+    for filename in os.listdir(RAW_FOLDER):
+        if filename.endswith(".csv"):
+            file_path = os.path.join(RAW_FOLDER, filename)
+            # Drop rows with missing review text or invalid rating, then type columns
+            df = validate_reviews(pd.read_csv(file_path), source=filename)
 
-        # Drop rows with missing review text or rating
-        df.dropna(subset=["Review Text", "Rating"], inplace=True)
+            # Clean review text and remove stopwords
+            df["Review Text"] = df["Review Text"].apply(clean_text)
 
-        # Clean review text and remove stopwords
-        df["Review Text"] = df["Review Text"].apply(clean_text)
+            # Assign product category
+            df["Product Category"] = df["Review Text"].apply(assign_category).astype("category")
 
-        # Assign product category
-        df["Product Category"] = df["Review Text"].apply(assign_category)
-
-        # Save cleaned file
-        cleaned_filename = filename.replace(".csv", "_cleaned.csv")
-        df.to_csv(os.path.join(CLEANED_FOLDER, cleaned_filename), index=False)
-        print(f"✅ Cleaned and categorized: {cleaned_filename}")
+            # Save cleaned file
+            cleaned_filename = filename.replace(".csv", "_cleaned.csv")
+            df.to_csv(os.path.join(CLEANED_FOLDER, cleaned_filename), index=False)
+            print(f"✅ Cleaned and categorized: {cleaned_filename}")
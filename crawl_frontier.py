@@ -0,0 +1,161 @@
+import os
+import json
+import time
+import sqlite3
+
+FRONTIER_DB = "data/crawl_frontier.db"
+
+MAX_ATTEMPTS = 5              # failures before a page is given up on
+BACKOFF_SECONDS = 30          # first retry delay, doubled on every failure
+MAX_BACKOFF_SECONDS = 3600
+RECRAWL_AFTER = 24 * 60 * 60  # seconds before a finished company is stale again
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    name TEXT PRIMARY KEY,
+    base_url TEXT NOT NULL,
+    round_started_at REAL,
+    last_crawled_at REAL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    company TEXT NOT NULL REFERENCES companies(name),
+    page INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    reviews TEXT,
+    PRIMARY KEY (company, page)
+);
+CREATE INDEX IF NOT EXISTS pages_pending ON pages (status, next_attempt_at);
+"""
+
+
+class CrawlFrontier:
+    """SQLite-backed queue of company/page work items.
+
+    Every page is a row: 'pending' until fetched, then 'done' with its parsed
+    reviews stored alongside, 'skipped' once an empty page shows the company
+    has no more reviews, or 'failed' after MAX_ATTEMPTS. A company's round is
+    finished when none of its pages are pending, so a restarted crawl picks up
+    exactly the pages that were still outstanding.
+    """
+
+    def __init__(self, path=FRONTIER_DB):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def seed(self, companies, pages, recrawl_after=RECRAWL_AFTER):
+        """Register companies and queue a new round for each stale one."""
+        now = time.time()
+        queued = []
+        with self.conn:
+            for name, base_url in companies.items():
+                self.conn.execute(
+                    "INSERT INTO companies (name, base_url) VALUES (?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET base_url = excluded.base_url",
+                    (name, base_url),
+                )
+                row = self.conn.execute(
+                    "SELECT round_started_at, last_crawled_at FROM companies WHERE name = ?", (name,)
+                ).fetchone()
+                if row["round_started_at"] is not None and (
+                    row["last_crawled_at"] is None or row["last_crawled_at"] < row["round_started_at"]
+                ):
+                    continue  # unfinished round, resume it
+                if row["last_crawled_at"] is not None and now - row["last_crawled_at"] < recrawl_after:
+                    continue
+                self.conn.execute("DELETE FROM pages WHERE company = ?", (name,))
+                self.conn.executemany(
+                    "INSERT INTO pages (company, page) VALUES (?, ?)",
+                    [(name, page) for page in range(1, pages + 1)],
+                )
+                self.conn.execute("UPDATE companies SET round_started_at = ? WHERE name = ?", (now, name))
+                queued.append(name)
+        return queued
+
+    def next_page(self, companies=None):
+        """Stalest company's lowest pending page that is due, or None."""
+        query = (
+            "SELECT p.company, p.page, p.attempts, c.base_url FROM pages p "
+            "JOIN companies c ON c.name = p.company "
+            "WHERE p.status = 'pending' AND p.next_attempt_at <= ?"
+        )
+        params = [time.time()]
+        if companies is not None:
+            query += f" AND p.company IN ({','.join('?' * len(companies))})"
+            params.extend(companies)
+        query += " ORDER BY COALESCE(c.last_crawled_at, 0), p.company, p.page LIMIT 1"
+        return self.conn.execute(query, params).fetchone()
+
+    def seconds_until_retry(self, companies=None):
+        """Delay until the next backed-off page is due, or None if nothing is pending."""
+        query = "SELECT MIN(next_attempt_at) FROM pages WHERE status = 'pending'"
+        params = []
+        if companies is not None:
+            query += f" AND company IN ({','.join('?' * len(companies))})"
+            params.extend(companies)
+        next_attempt_at = self.conn.execute(query, params).fetchone()[0]
+        if next_attempt_at is None:
+            return None
+        return max(0.0, next_attempt_at - time.time())
+
+    def complete_page(self, company, page, reviews):
+        """Checkpoint a fetched page's parsed reviews."""
+        with self.conn:
+            self.conn.execute(
+                "UPDATE pages SET status = 'done', reviews = ?, last_error = NULL "
+                "WHERE company = ? AND page = ?",
+                (json.dumps(reviews), company, page),
+            )
+            if not reviews:
+                # Past the last page of reviews; later pages would be empty too
+                self.conn.execute(
+                    "UPDATE pages SET status = 'skipped' "
+                    "WHERE company = ? AND page > ? AND status = 'pending'",
+                    (company, page),
+                )
+
+    def fail_page(self, company, page, error):
+        """Schedule a retry with exponential backoff, or give up on the page."""
+        attempts = self.conn.execute(
+            "SELECT attempts FROM pages WHERE company = ? AND page = ?", (company, page)
+        ).fetchone()["attempts"] + 1
+        delay = min(BACKOFF_SECONDS * 2 ** (attempts - 1), MAX_BACKOFF_SECONDS)
+        status = "failed" if attempts >= MAX_ATTEMPTS else "pending"
+        with self.conn:
+            self.conn.execute(
+                "UPDATE pages SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ? "
+                "WHERE company = ? AND page = ?",
+                (status, attempts, time.time() + delay, error, company, page),
+            )
+        return status, delay
+
+    def finished_rounds(self):
+        """Companies whose pages are all settled but whose round isn't closed yet."""
+        rows = self.conn.execute(
+            "SELECT name FROM companies c "
+            "WHERE round_started_at IS NOT NULL "
+            "AND (last_crawled_at IS NULL OR last_crawled_at < round_started_at) "
+            "AND NOT EXISTS (SELECT 1 FROM pages p WHERE p.company = c.name AND p.status = 'pending')"
+        ).fetchall()
+        return [row["name"] for row in rows]
+
+    def page_reviews(self, company):
+        rows = self.conn.execute(
+            "SELECT reviews FROM pages WHERE company = ? AND status = 'done' ORDER BY page", (company,)
+        ).fetchall()
+        return [review for row in rows for review in json.loads(row["reviews"])]
+
+    def finish_round(self, company):
+        with self.conn:
+            self.conn.execute("UPDATE companies SET last_crawled_at = ? WHERE name = ?", (time.time(), company))
+
+    def summary(self):
+        rows = self.conn.execute("SELECT status, COUNT(*) AS n FROM pages GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
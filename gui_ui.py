@@ -5,6 +5,7 @@ import time
 import threading
 import os
 import webbrowser
+import json
 
 steps = [
     ("Scraping reviews", "scrape.py"),
@@ -14,7 +15,8 @@ steps = [
     ("Generating report", "report_generator.py")
 ]
 
-companies_available = ["Flipkart", "Amazon", "Meesho", "Myntra"]
+with open("companies.json", "r") as f:
+    companies_available = list(json.load(f))
 selected_companies = []
 log_lines = []
 theme_mode = "dark"
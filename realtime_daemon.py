@@ -0,0 +1,219 @@
+import os
+import json
+import time
+import hashlib
+import signal
+import argparse
+from collections import deque
+import requests
+import pandas as pd
+
+from scrape import RAW_FOLDER, companies, fetch_page, parse_reviews, save_reviews
+from clean import clean_text, assign_category
+from eda import analyzer, classify_sentiment
+from schema import validate_reviews
+from churn_cube import ChurnCube
+
+REALTIME_FOLDER = "data/realtime"
+OUTPUT_FOLDER = "model_output"
+SNAPSHOT_FILE = os.path.join(REALTIME_FOLDER, "churn_window_snapshot.json")
+PREDICTIONS_FILE = os.path.join(OUTPUT_FOLDER, "churn_predictions.json")
+os.makedirs(REALTIME_FOLDER, exist_ok=True)
+os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+
+POLL_INTERVAL = 60        # seconds between polling rounds
+MAX_POLL_PAGES = 5        # newest pages checked per company per round
+WINDOW_SIZE = 200         # most recent reviews kept per company/category
+MIN_REVIEWS = 10          # same threshold train.py uses before reporting churn
+
+
+class ChurnWindow:
+    """Sliding window over the latest reviews of one company/category."""
+
+    def __init__(self, size=WINDOW_SIZE):
+        self.reviews = deque(maxlen=size)
+        self.churned = 0
+        self.sentiment_total = 0.0
+
+    def add(self, churn, sentiment_score):
+        if len(self.reviews) == self.reviews.maxlen:
+            old_churn, old_score = self.reviews[0]
+            self.churned -= old_churn
+            self.sentiment_total -= old_score
+        self.reviews.append((churn, sentiment_score))
+        self.churned += churn
+        self.sentiment_total += sentiment_score
+
+    def churn_pct(self):
+        return round(self.churned / len(self.reviews) * 100, 2)
+
+    def avg_sentiment(self):
+        return round(self.sentiment_total / len(self.reviews), 4)
+
+
+def review_key(review):
+    # Same identity scrape.py uses when de-duplicating the raw CSVs
+    raw = f"{review['Review Date']}|{review['Review Text']}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+def load_snapshot():
+    state = {"seen": set(), "windows": {}}
+    if not os.path.exists(SNAPSHOT_FILE):
+        return state
+    with open(SNAPSHOT_FILE, "r") as f:
+        snapshot = json.load(f)
+    state["seen"] = set(snapshot["seen"])
+    for company, categories in snapshot["windows"].items():
+        for category, reviews in categories.items():
+            window = ChurnWindow()
+            for churn, score in reviews:
+                window.add(churn, score)
+            state["windows"].setdefault(company, {})[category] = window
+    print(f"♻️ Restored {len(state['seen'])} seen reviews from {SNAPSHOT_FILE}")
+    return state
+
+def seed_seen_from_raw(state, company_names):
+    """Mark reviews already saved to data/raw (by scrape.py or an earlier run) as seen.
+
+    eda.py builds the churn cube from those same reviews, so counting them
+    again here would inflate it.
+    """
+    for name in company_names:
+        filename = os.path.join(RAW_FOLDER, f"{name.lower()}_reviews.csv")
+        if not os.path.exists(filename):
+            continue
+        raw_df = pd.read_csv(filename, dtype=str, keep_default_na=False)
+        before = len(state["seen"])
+        state["seen"].update(review_key(review) for review in raw_df.to_dict("records"))
+        print(f"📂 [{name}] {len(state['seen']) - before} reviews already in {filename}")
+
+def write_json_atomic(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+def save_snapshot(state):
+    windows = {
+        company: {category: list(window.reviews) for category, window in categories.items()}
+        for company, categories in state["windows"].items()
+    }
+    write_json_atomic(SNAPSHOT_FILE, {"seen": sorted(state["seen"]), "windows": windows})
+    print(f"💾 Snapshot saved: {SNAPSHOT_FILE}")
+
+def write_predictions(state, min_reviews=MIN_REVIEWS):
+    # Update train.py's predictions in place; categories the daemon hasn't
+    # filled a window for keep their batch churn %
+    churn_json = dict()
+    if os.path.exists(PREDICTIONS_FILE):
+        with open(PREDICTIONS_FILE, "r") as f:
+            churn_json = json.load(f)
+    for company, categories in state["windows"].items():
+        for category, window in categories.items():
+            if len(window.reviews) < min_reviews:
+                continue
+            churn_json.setdefault(company, dict())[category] = window.churn_pct()
+    write_json_atomic(PREDICTIONS_FILE, churn_json)
+
+def poll_company(company_name, base_url, state):
+    """Fetch newest pages until one overlaps reviews we've already seen.
+
+    Nothing is marked as seen here; run() does that once the returned
+    reviews have been processed, so a failed poll is retried next round.
+    """
+    new_reviews = []
+    batch_keys = set()
+    for page in range(1, MAX_POLL_PAGES + 1):
+        try:
+            page_reviews = parse_reviews(fetch_page(base_url, page), company_name)
+        except requests.RequestException as e:
+            print(f"⚠️ [{company_name}] Poll stopped at page {page}: {e}")
+            break
+        fresh = []
+        for review in page_reviews:
+            key = review_key(review)
+            if key not in state["seen"] and key not in batch_keys:
+                batch_keys.add(key)
+                fresh.append(review)
+        new_reviews.extend(fresh)
+        if not page_reviews or len(fresh) < len(page_reviews):
+            break
+        time.sleep(1)
+    return new_reviews
+
+def process_review(review, state):
+    rating = review["Rating"]
+    text = clean_text(str(review["Review Text"]))
+    category = assign_category(text)
+    sentiment_score = analyzer.polarity_scores(text)["compound"]
+
+    # Keys match train.py's output, which names companies after the cleaned CSVs
+    company = f"{review['Company'].lower()}_reviews"
+    windows = state["windows"].setdefault(company, {})
+    window = windows.setdefault(category, ChurnWindow())
+    window.add(int(rating <= 2), sentiment_score)
+    print(f"   ↳ {review['Company']} - {category}: rating {rating}, "
+          f"{classify_sentiment(sentiment_score)}, churn now {window.churn_pct()}%")
+    return {**review, "Product Category": category, "Sentiment Score": sentiment_score}
+
+def stop_on_sigterm(signum, frame):
+    # Service managers stop the daemon with SIGTERM; shut down like Ctrl-C
+    raise KeyboardInterrupt
+
+def run(targets, interval=POLL_INTERVAL, min_reviews=MIN_REVIEWS):
+    signal.signal(signal.SIGTERM, stop_on_sigterm)
+    state = load_snapshot()
+    seed_seen_from_raw(state, targets)
+    cube = ChurnCube()
+    try:
+        while True:
+            for name, base_url in targets.items():
+                new_reviews = poll_company(name, base_url, state)
+                if not new_reviews:
+                    continue
+                print(f"🆕 [{name}] {len(new_reviews)} new reviews")
+                valid_reviews = validate_reviews(pd.DataFrame(new_reviews), source=f"{name} poll")
+                scored = [process_review(review, state) for review in valid_reviews.to_dict("records")]
+
+                # Persist the raw reviews first: if the process dies before the
+                # cube and snapshot are saved, the restart seeds seen from data/raw
+                # and skips them (leaving them for eda.py) instead of counting twice
+                save_reviews(name, new_reviews)
+                if scored:
+                    # Only reviews missing from data/raw get here (see seed_seen_from_raw),
+                    # so nothing eda.py already counted is added again
+                    cube.add_reviews(pd.DataFrame(scored))
+                    cube.save()
+                state["seen"].update(review_key(review) for review in new_reviews)
+                save_snapshot(state)
+                write_predictions(state, min_reviews)
+
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("🛑 Stopping real-time mode...")
+    finally:
+        save_snapshot(state)
+        cube.save()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Poll review pages and keep churn predictions up to date.")
+    parser.add_argument("companies", nargs="*", help="Companies from scrape.py to poll (default: all)")
+    parser.add_argument("--url", action="append", default=[], metavar="NAME=URL",
+                        help="Override or add a company's review URL, e.g. a local stand-in server")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL, help="Seconds between polling rounds")
+    parser.add_argument("--min-reviews", type=int, default=MIN_REVIEWS,
+                        help="Reviews needed in a window before its churn is published")
+    args = parser.parse_args()
+
+    targets = dict(companies)
+    for override in args.url:
+        name, url = override.split("=", 1)
+        targets[name] = url
+    if args.companies:
+        unknown = [name for name in args.companies if name not in targets]
+        for name in unknown:
+            print(f"⚠️ Unknown company: {name}")
+        targets = {name: targets[name] for name in args.companies if name in targets}
+
+    run(targets, interval=args.interval, min_reviews=args.min_reviews)
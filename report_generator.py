@@ -4,6 +4,7 @@ from datetime import datetime
 from glob import glob
 import pandas as pd
 from fpdf import FPDF
+from churn_cube import ChurnCube
 
 # Define paths
 OUTPUT_FOLDER = "model_output"
@@ -23,6 +24,15 @@ with open(churn_json, "r") as f:
 # Count scraped data
 total_reviews = metrics_df.shape[0]
 
+# Review-level totals and trends come from the churn cube built by eda.py
+cube = ChurnCube()
+overall = cube.window()
+if overall["reviews"]:
+    reviews_summary = f"{overall['reviews']} (overall churn: {overall['churn_pct']}%)"
+else:
+    reviews_summary = "0 (churn cube is empty, run eda.py)"
+weekly_changes = cube.latest_changes(freq="W")
+
 # Get date and summary insights
 now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 most_churn_row = metrics_df.sort_values(by="Churn %", ascending=False).iloc[0]
@@ -44,6 +54,7 @@ This report summarizes the customer churn analysis pipeline run on latest scrape
 The scraping covered multiple companies from Trustpilot and churn models were trained on real-time data.
 
 - Total Models Trained: {total_reviews}
+- Total Reviews Analysed: {reviews_summary}
 - Most At-Risk Category: {most_churn_row['Category']} on {most_churn_row['Company']} ({most_churn_row['Churn %']}% churn)
 - Best Performing Model: {best_model_row['Model']} on {best_model_row['Company']} - {best_model_row['Category']} (F1 Score: {best_model_row['F1 Score']})
 ''')
@@ -65,6 +76,33 @@ for company, categories in churn_data.items():
         pdf.cell(60, 8, category, 1)
         pdf.cell(30, 8, f"{churn}%", 1, 1)
 
+# Add Week-over-Week Churn Trend from the churn cube
+if not weekly_changes.empty:
+    pdf.add_page()
+    pdf.set_font("Arial", 'B', 14)
+    pdf.cell(0, 10, "Week-over-Week Churn Trend", ln=True)
+    pdf.set_font("Arial", size=10)
+
+    pdf.cell(35, 8, "Company", 1, 0, 'C', True)
+    pdf.cell(45, 8, "Category", 1, 0, 'C', True)
+    pdf.cell(30, 8, "Week Of", 1, 0, 'C', True)
+    pdf.cell(25, 8, "Churn %", 1, 0, 'C', True)
+    pdf.cell(25, 8, "Prev Week", 1, 0, 'C', True)
+    pdf.cell(25, 8, "Change", 1, 1, 'C', True)
+
+    for _, row in weekly_changes.sort_values(by="churn_change", ascending=False).iterrows():
+        pdf.cell(35, 8, row["company"].capitalize(), 1)
+        pdf.cell(45, 8, row["category"], 1)
+        pdf.cell(30, 8, row["period"].strftime("%Y-%m-%d"), 1)
+        pdf.cell(25, 8, f"{row['churn_pct']}%", 1)
+        # No previous-week figure when that week had no reviews
+        if pd.isna(row["previous_churn_pct"]):
+            pdf.cell(25, 8, "n/a", 1)
+            pdf.cell(25, 8, "n/a", 1, 1)
+        else:
+            pdf.cell(25, 8, f"{row['previous_churn_pct']}%", 1)
+            pdf.cell(25, 8, f"{row['churn_change']:+.2f}", 1, 1)
+
 # Add Model Comparison Table from CSV
 pdf.add_page()
 pdf.set_font("Arial", 'B', 14)
@@ -0,0 +1,113 @@
+import time
+import argparse
+import threading
+from datetime import datetime, timezone
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+REVIEWS_PER_PAGE = 20
+
+# (review text, rating) pairs cycled through when publishing
+SAMPLE_REVIEWS = [
+    ("Order arrived late and the refund never came", 1),
+    ("Great smartphone, fast delivery and good packaging", 5),
+    ("The dress quality is worst, fabric tore after one wash", 1),
+    ("Headphones sound amazing for the price", 4),
+    ("Fake product delivered, support cheated me", 2),
+    ("Shirt fits well and the colour is exactly as shown", 5),
+    ("Grocery items were expired, very bad experience", 1),
+    ("Laptop works fine, delivery took a bit long", 3),
+]
+
+
+class ReviewStubServer:
+    """Local stand-in for a Trustpilot review page that keeps publishing reviews.
+
+    Pages are rendered with the same markup scrape.parse_reviews() reads,
+    newest review first, so the real-time daemon can poll it via --url.
+    """
+
+    def __init__(self, host="127.0.0.1", port=8765):
+        self.reviews = []
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                page = int(parse_qs(urlparse(self.path).query).get("page", ["1"])[0])
+                body = server.render_page(page).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/review/stub"
+
+    def publish(self, text=None, rating=None):
+        with self.lock:
+            sample_text, sample_rating = SAMPLE_REVIEWS[len(self.reviews) % len(SAMPLE_REVIEWS)]
+            review = {
+                "title": f"Review #{len(self.reviews) + 1}",
+                # Numbered so every review stays unique on (date, text)
+                "text": f"{text or sample_text} (#{len(self.reviews) + 1})",
+                "rating": rating if rating is not None else sample_rating,
+                "date": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            }
+            self.reviews.insert(0, review)
+        return review
+
+    def render_page(self, page):
+        with self.lock:
+            chunk = self.reviews[(page - 1) * REVIEWS_PER_PAGE:page * REVIEWS_PER_PAGE]
+        articles = "".join(
+            f'<article><h2>{escape(r["title"])}</h2><p>{escape(r["text"])}</p>'
+            f'<div data-service-review-rating="{r["rating"]}"></div>'
+            f'<time datetime="{r["date"]}"></time></article>'
+            for r in chunk
+        )
+        return f"<html><body>{articles}</body></html>"
+
+    def _publish_forever(self, every):
+        while not self.stopped.wait(every):
+            self.publish()
+
+    def start(self, publish_every=None):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        if publish_every:
+            threading.Thread(target=self._publish_forever, args=(publish_every,), daemon=True).start()
+
+    def stop(self):
+        self.stopped.set()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a review page that keeps publishing new reviews.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--every", type=float, default=5, help="Seconds between new reviews")
+    parser.add_argument("--initial", type=int, default=20, help="Reviews published at startup")
+    args = parser.parse_args()
+
+    server = ReviewStubServer(port=args.port)
+    for _ in range(args.initial):
+        server.publish()
+    server.start(publish_every=args.every)
+    print(f"🧪 Stand-in review server at {server.url} (new review every {args.every}s)")
+    print(f"   Try: python realtime_daemon.py Stub --url Stub={server.url} --interval 2")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
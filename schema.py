@@ -0,0 +1,90 @@
+import pandas as pd
+
+# Shared in-memory layout for reviews across scrape/clean/eda/train.
+# Repeated labels are categoricals, ratings are int8, dates are datetime64
+# and free text is Arrow-backed instead of one Python object per cell.
+TEXT_DTYPE = pd.StringDtype("pyarrow")
+
+CATEGORY_COLUMNS = ["Company", "Product Category", "Sentiment"]
+TEXT_COLUMNS = ["Review Title", "Review Text"]
+DATE_COLUMN = "Review Date"
+RATING_COLUMN = "Rating"
+REQUIRED_COLUMNS = ["Review Text", "Rating"]
+
+CSV_DTYPES = {
+    **{col: "category" for col in CATEGORY_COLUMNS},
+    **{col: TEXT_DTYPE for col in TEXT_COLUMNS},
+    RATING_COLUMN: str,
+    "Sentiment Score": "float32",
+}
+
+
+def apply_schema(df):
+    """Cast an already-validated review frame to the shared dtypes."""
+    df = df.copy()
+    for col in TEXT_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(TEXT_DTYPE)
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    if RATING_COLUMN in df.columns:
+        df[RATING_COLUMN] = pd.to_numeric(df[RATING_COLUMN]).astype("int8")
+    if DATE_COLUMN in df.columns:
+        df[DATE_COLUMN] = pd.to_datetime(df[DATE_COLUMN], errors="coerce")
+    if "Sentiment Score" in df.columns:
+        df["Sentiment Score"] = df["Sentiment Score"].astype("float32")
+    return df
+
+def validate_reviews(df, source="reviews"):
+    """Drop rows without text or a 1-5 rating, then apply the schema.
+
+    Called once where reviews enter the pipeline; later stages trust the
+    cleaned CSVs and only use load_reviews().
+    """
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"{source} is missing required columns: {missing}")
+
+    ratings = pd.to_numeric(df[RATING_COLUMN], errors="coerce")
+    valid = df["Review Text"].notna() & ratings.between(1, 5) & (ratings % 1 == 0)
+    dropped = int((~valid).sum())
+    if dropped:
+        print(f"⚠️ Dropped {dropped} invalid rows from {source} (missing text or rating outside 1-5)")
+
+    df = df[valid].assign(**{RATING_COLUMN: ratings[valid]})
+    return apply_schema(df).reset_index(drop=True)
+
+def load_reviews(path):
+    """Read a reviews CSV written by the pipeline straight into the shared dtypes."""
+    df = pd.read_csv(path, dtype=CSV_DTYPES)
+    return apply_schema(df)
+
+
+if __name__ == "__main__":
+    # Measure the saving on one million synthetic reviews
+    import numpy as np
+
+    rows = 1_000_000
+    rng = np.random.default_rng(42)
+    companies = np.array(["Flipkart", "Amazon", "Meesho", "Myntra"])
+    categories = np.array(["Electronics", "Fashion", "Grocery", "Home", "General"])
+    words = np.array(["delivery", "late", "refund", "quality", "good", "bad", "product", "order", "support", "fast"])
+    texts = [" ".join(rng.choice(words, size=12)) for _ in range(rows)]
+    dates = pd.date_range("2024-01-01", periods=365).strftime("%Y-%m-%d").to_numpy()
+
+    untyped = pd.DataFrame({
+        "Company": rng.choice(companies, rows),
+        "Review Title": rng.choice(words, rows),
+        "Rating": rng.integers(1, 6, rows).astype(str),
+        "Review Text": texts,
+        "Review Date": rng.choice(dates, rows),
+        "Product Category": rng.choice(categories, rows),
+    }).astype(object)
+    typed = validate_reviews(untyped, source="benchmark")
+
+    before = untyped.memory_usage(deep=True).sum() / 1024 ** 2
+    after = typed.memory_usage(deep=True).sum() / 1024 ** 2
+    print(f"Object dtypes: {before:,.1f} MiB per {rows:,} reviews")
+    print(f"Shared schema: {after:,.1f} MiB per {rows:,} reviews")
+    print(f"Saving: {before - after:,.1f} MiB ({(1 - after / before) * 100:.1f}%)")
@@ -2,55 +2,59 @@ import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import os
+import json
 import time
 import sys
 from datetime import datetime
+from crawl_frontier import CrawlFrontier
 
 RAW_FOLDER = "data/raw"
+COMPANIES_FILE = "companies.json"
+PAGES_PER_COMPANY = 50
 os.makedirs(RAW_FOLDER, exist_ok=True)
 
-companies = {
-    "Flipkart": "https://www.trustpilot.com/review/www.flipkart.com",
-    "Amazon": "https://www.trustpilot.com/review/www.amazon.in",
-    "Meesho": "https://www.trustpilot.com/review/meesho.com",
-    "Myntra": "https://www.trustpilot.com/review/www.myntra.com"
+# Company name -> Trustpilot review URL
+with open(COMPANIES_FILE, "r") as f:
+    companies = json.load(f)
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
 }
 
-def scrape_company_reviews(company_name, base_url, pages=10):
-    all_reviews = []
-    for page in range(1, pages + 1):
-        print(f"[{company_name}] Scraping page {page}...")
-        url = f"{base_url}?page={page}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-        }
-        response = requests.get(url, headers=headers)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        review_blocks = soup.find_all("article")
-
-        for review in review_blocks:
-            try:
-                title = review.find("h2").text.strip() if review.find("h2") else "No Title"
-                body = review.find("p").text.strip() if review.find("p") else "No Text"
-                rating = review.find("div", {"data-service-review-rating": True})
-                rating = rating["data-service-review-rating"] if rating else "N/A"
-                date_tag = review.find("time")
-                review_date = date_tag["datetime"].split("T")[0] if date_tag else "N/A"
-
-                all_reviews.append({
-                    "Company": company_name,
-                    "Review Title": title,
-                    "Rating": rating,
-                    "Review Text": body,
-                    "Review Date": review_date
-                })
-            except Exception as e:
-                print(f"Error parsing review for {company_name}: {e}")
-                continue
+def fetch_page(base_url, page):
+    url = f"{base_url}?page={page}"
+    response = requests.get(url, headers=HEADERS, timeout=30)
+    response.raise_for_status()
+    return response.text
 
-        time.sleep(1)
+def parse_reviews(html, company_name):
+    reviews = []
+    soup = BeautifulSoup(html, 'html.parser')
+    review_blocks = soup.find_all("article")
+
+    for review in review_blocks:
+        try:
+            title = review.find("h2").text.strip() if review.find("h2") else "No Title"
+            body = review.find("p").text.strip() if review.find("p") else "No Text"
+            rating = review.find("div", {"data-service-review-rating": True})
+            rating = rating["data-service-review-rating"] if rating else "N/A"
+            date_tag = review.find("time")
+            review_date = date_tag["datetime"].split("T")[0] if date_tag else "N/A"
 
-    new_df = pd.DataFrame(all_reviews)
+            reviews.append({
+                "Company": company_name,
+                "Review Title": title,
+                "Rating": rating,
+                "Review Text": body,
+                "Review Date": review_date
+            })
+        except Exception as e:
+            print(f"Error parsing review for {company_name}: {e}")
+            continue
+    return reviews
+
+def save_reviews(company_name, reviews):
+    new_df = pd.DataFrame(reviews)
     filename = os.path.join(RAW_FOLDER, f"{company_name.lower()}_reviews.csv")
 
     if os.path.exists(filename):
@@ -63,12 +67,69 @@ def scrape_company_reviews(company_name, base_url, pages=10):
         new_df.to_csv(filename, index=False)
         print(f"✅ [{company_name}] First scrape done. {len(new_df)} reviews saved.")
 
-# Read companies from command-line args
-selected_companies = sys.argv[1:] if len(sys.argv) > 1 else companies.keys()
+def finish_company(frontier, company_name):
+    reviews = frontier.page_reviews(company_name)
+    if reviews:
+        save_reviews(company_name, reviews)
+    frontier.finish_round(company_name)
 
-# Scrape only selected companies
-for name in selected_companies:
-    if name in companies:
-        scrape_company_reviews(name, companies[name], pages=50)
-    else:
-        print(f"⚠️ Unknown company: {name}")
+def crawl(frontier, selected):
+    # Flush companies whose pages all completed before a previous run stopped
+    for name in frontier.finished_rounds():
+        if name in selected:
+            finish_company(frontier, name)
+
+    while True:
+        item = frontier.next_page(selected)
+        if item is None:
+            wait = frontier.seconds_until_retry(selected)
+            if wait is None:
+                break
+            print(f"⏳ Waiting {wait:.0f}s for pages in backoff...")
+            time.sleep(wait)
+            continue
+
+        company_name, page = item["company"], item["page"]
+        print(f"[{company_name}] Scraping page {page}...")
+        try:
+            reviews = parse_reviews(fetch_page(item["base_url"], page), company_name)
+        except requests.RequestException as e:
+            status_code = e.response.status_code if e.response is not None else None
+            if status_code is not None and 400 <= status_code < 500 and status_code != 429:
+                # Past the company's last page or a bad URL; retrying won't help,
+                # so treat it like an empty page and skip the remaining pages
+                print(f"⏭️ [{company_name}] Page {page} returned {status_code}, skipping remaining pages")
+                frontier.complete_page(company_name, page, [])
+            else:
+                # Timeouts, connection errors, 429 and 5xx are worth retrying
+                status, delay = frontier.fail_page(company_name, page, str(e))
+                if status == "failed":
+                    print(f"❌ [{company_name}] Giving up on page {page}: {e}")
+                else:
+                    print(f"⚠️ [{company_name}] Page {page} failed, retrying in {delay}s: {e}")
+        else:
+            frontier.complete_page(company_name, page, reviews)
+
+        if company_name in frontier.finished_rounds():
+            finish_company(frontier, company_name)
+        time.sleep(1)
+
+if __name__ == "__main__":
+    # Read companies from command-line args
+    selected_companies = sys.argv[1:] if len(sys.argv) > 1 else list(companies)
+    for name in selected_companies:
+        if name not in companies:
+            print(f"⚠️ Unknown company: {name}")
+    selected = {name: companies[name] for name in selected_companies if name in companies}
+
+    # Queue stale companies and resume any unfinished pages from the last run
+    frontier = CrawlFrontier()
+    queued = frontier.seed(selected, pages=PAGES_PER_COMPANY)
+    print(f"🗂️ Queued {len(queued)} stale companies, resuming the rest: {frontier.summary()}")
+    try:
+        crawl(frontier, list(selected))
+    except KeyboardInterrupt:
+        print("🛑 Crawl interrupted, completed pages are checkpointed.")
+    finally:
+        print(f"📊 Frontier status: {frontier.summary()}")
+        frontier.close()
@@ -10,6 +10,7 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import classification_report, confusion_matrix
 import json
 import shutil
+from schema import load_reviews
 
 CLEANED_FOLDER = "data/cleaned"
 OUTPUT_FOLDER = "model_output"
@@ -26,10 +27,8 @@ for file in os.listdir(CLEANED_FOLDER):
         continue
 
     company = file.replace("_cleaned.csv", "")
-    df = pd.read_csv(os.path.join(CLEANED_FOLDER, file))
-    df = df.dropna(subset=["Review Text", "Rating", "Product Category"])
-    df["Rating"] = pd.to_numeric(df["Rating"], errors='coerce')
-    df = df.dropna(subset=["Rating"])
+    df = load_reviews(os.path.join(CLEANED_FOLDER, file))
+    df = df.dropna(subset=["Review Text", "Product Category"])
 
     df["Churn"] = (df["Rating"] <= 2).astype(int)
 